@@ -145,7 +145,7 @@ class TestFontSelectionAPI:
         """Test handling of Google Fonts API failures."""
         pytest.fail("Test should fail initially - implement after API error handling")
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("API unavailable")
 
             criteria = FontSelectionCriteria(
@@ -237,4 +237,74 @@ class TestFontSelectionAPI:
         assert metadata.selection_method in ["rule-based", "llm-enhanced", "hybrid"]
         assert metadata.fonts_considered > 0
         assert metadata.api_calls_made is not None
-        assert isinstance(metadata.cache_hit, bool)
\ No newline at end of file
+        assert isinstance(metadata.cache_hit, bool)
+
+    def test_select_fonts_reuses_cached_selection(self, monkeypatch):
+        """Test that repeated criteria are served from the selection cache."""
+        import brand_identity_generator as generator
+        from brand_identity_generator import FontSelectionCriteria
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import select_fonts
+
+        fonts = [
+            GoogleFont(family="Inter", category="sans-serif", variants=["400", "700"]),
+            GoogleFont(
+                family="Merriweather", category="serif", variants=["400", "700"]
+            ),
+        ]
+        monkeypatch.setattr(generator, "fetch_google_fonts", lambda: fonts)
+        monkeypatch.setattr(generator, "_SELECTION_CACHE", {})
+
+        criteria = FontSelectionCriteria(
+            brand_personality=["professional", "modern"],
+            target_audience="enterprise users",
+            brand_voice="authoritative",
+            enhancement_level="moderate",
+        )
+
+        first = select_fonts(criteria)
+        second = select_fonts(criteria)
+
+        # Contract: the repeat is a cache hit with the same typography
+        assert first.selection_metadata.cache_hit is False
+        assert second.selection_metadata.cache_hit is True
+        assert second.typography == first.typography
+
+    def test_select_fonts_cached_selection_is_isolated(self, monkeypatch):
+        """Test that mutating one response never changes later cache hits."""
+        import brand_identity_generator as generator
+        from brand_identity_generator import FontSelectionCriteria
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import select_fonts
+
+        fonts = [
+            GoogleFont(family="Inter", category="sans-serif", variants=["400", "700"]),
+            GoogleFont(
+                family="Merriweather", category="serif", variants=["400", "700"]
+            ),
+        ]
+        monkeypatch.setattr(generator, "fetch_google_fonts", lambda: fonts)
+        monkeypatch.setattr(generator, "_SELECTION_CACHE", {})
+
+        criteria = FontSelectionCriteria(
+            brand_personality=["professional", "modern"],
+            target_audience="enterprise users",
+            brand_voice="authoritative",
+            enhancement_level="moderate",
+        )
+
+        first = select_fonts(criteria)
+        expected = first.typography.model_dump()
+
+        # Mutate everything a caller could reach on the first response
+        first.typography.heading_styles.clear()
+        first.typography.primary_font.recommended_weights.append("900")
+
+        second = select_fonts(criteria)
+        second.typography.text_styles.clear()
+        third = select_fonts(criteria)
+
+        # Contract: each hit gets an untouched copy of the original selection
+        assert second.selection_metadata.cache_hit is True
+        assert third.selection_metadata.cache_hit is True
+        assert third.typography.model_dump() == expected
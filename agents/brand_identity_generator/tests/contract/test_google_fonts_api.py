@@ -179,14 +179,14 @@ class TestGoogleFontsAPIIntegration:
         pytest.fail("Test should fail initially - implement after error handling")
 
         # Test network timeout
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("Connection timeout")
 
             with pytest.raises(GoogleFontsAPIError):
                 fetch_google_fonts()
 
         # Test invalid API key
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 403
             mock_response.json.return_value = {
@@ -198,7 +198,7 @@ class TestGoogleFontsAPIIntegration:
                 fetch_google_fonts(api_key="invalid_key")
 
         # Test API rate limiting
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_response.json.return_value = {
@@ -291,4 +291,166 @@ class TestGoogleFontsAPIIntegration:
         ]
 
         missing_fonts = [font for font in popular_fonts if font not in font_families]
-        assert len(missing_fonts) == 0, f"Missing popular fonts: {missing_fonts}"
\ No newline at end of file
+        assert len(missing_fonts) == 0, f"Missing popular fonts: {missing_fonts}"
+
+    def test_fetch_google_fonts_conditional_revalidation(self, tmp_path, monkeypatch):
+        """Test that a 304 response reuses the cached catalog."""
+        import brand_identity_generator as generator
+        from brand_identity_generator import fetch_google_fonts, get_cached_fonts
+
+        monkeypatch.setattr(generator, "FONT_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(
+            generator, "FONT_CACHE_FILE", tmp_path / "google_fonts_cache.json"
+        )
+        monkeypatch.setattr(
+            generator, "FONT_CACHE_META_FILE", tmp_path / "google_fonts_cache.meta.json"
+        )
+        monkeypatch.setattr(generator, "_FONTS_MEMO", None)
+
+        items = [
+            {
+                "family": f"Font {i}",
+                "category": "serif",
+                "variants": ["regular"],
+                "lastModified": "2024-01-01",
+            }
+            for i in range(800)
+        ]
+        last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        full_response = MagicMock(
+            status_code=200, headers={"ETag": '"v1"', "Last-Modified": last_modified}
+        )
+        full_response.content = json.dumps({"items": items}).encode()
+
+        with patch("requests.Session.get", return_value=full_response):
+            fonts = fetch_google_fonts(api_key="test_key", force_refresh=True)
+        assert fonts[0].last_modified == "2024-01-01"
+        meta_bytes = generator.FONT_CACHE_META_FILE.read_bytes()
+
+        # Age the cache past its TTL while the parsed catalog stays memoized
+        stale = time.time() - 48 * 3600
+        os.utime(generator.FONT_CACHE_FILE, (stale, stale))
+        generator._memoize_fonts(fonts)
+
+        with patch(
+            "requests.Session.get", return_value=MagicMock(status_code=304)
+        ) as mock_get:
+            revalidated = fetch_google_fonts(api_key="test_key")
+
+        # Contract: the request is conditional on the saved validators
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == last_modified
+
+        # Contract: 304 is a cache hit on the memoized catalog, refreshes the
+        # cache age and leaves the saved validators untouched
+        assert mock_get.call_count == 1
+        assert revalidated is fonts
+        assert get_cached_fonts() is fonts
+        assert generator.FONT_CACHE_META_FILE.read_bytes() == meta_bytes
+
+    def test_update_font_cache_concurrent_writers(self, tmp_path, monkeypatch):
+        """Test that simultaneous cache updates neither fail nor tear the file."""
+        import threading
+
+        import brand_identity_generator as generator
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import get_cached_fonts
+        from brand_identity_generator import update_font_cache
+
+        monkeypatch.setattr(generator, "FONT_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(
+            generator, "FONT_CACHE_FILE", tmp_path / "google_fonts_cache.json"
+        )
+        monkeypatch.setattr(generator, "_FONTS_MEMO", None)
+
+        # Each writer publishes a catalog of its own size, so a torn or mixed
+        # file cannot pass for any single writer's payload
+        writer_sizes = [100, 200, 300, 400]
+        results = []
+
+        def update_worker(size):
+            fonts = [
+                GoogleFont(family=f"Font {i}", category="serif", variants=["regular"])
+                for i in range(size)
+            ]
+            for _ in range(10):
+                results.append(update_font_cache(fonts))
+
+        threads = [
+            threading.Thread(target=update_worker, args=(size,))
+            for size in writer_sizes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Contract: every write succeeds and no temp files are left behind
+        assert all(results)
+        assert not list(tmp_path.glob("*.tmp"))
+        assert [path.name for path in tmp_path.iterdir()] == ["google_fonts_cache.json"]
+
+        # Contract: the surviving file is one writer's complete catalog
+        data = json.loads(generator.FONT_CACHE_FILE.read_text())
+        assert len(data["fonts"]) in writer_sizes
+        cached = get_cached_fonts()
+        assert cached is not None
+        assert len(cached) == len(data["fonts"])
+
+    def test_get_cached_fonts_memoizes_until_cache_changes(self, tmp_path, monkeypatch):
+        """Test that repeated cache reads reuse the parsed catalog."""
+        import brand_identity_generator as generator
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import get_cached_fonts
+        from brand_identity_generator import update_font_cache
+
+        monkeypatch.setattr(generator, "FONT_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(
+            generator, "FONT_CACHE_FILE", tmp_path / "google_fonts_cache.json"
+        )
+        monkeypatch.setattr(generator, "_FONTS_MEMO", None)
+
+        fonts = [
+            GoogleFont(family=f"Font {i}", category="serif", variants=["regular"])
+            for i in range(5)
+        ]
+        assert update_font_cache(fonts)
+
+        # Contract: an unchanged cache file is not parsed again
+        first = get_cached_fonts()
+        assert get_cached_fonts() is first
+
+        # Contract: a new mtime alone (same size) invalidates the memo
+        stat = generator.FONT_CACHE_FILE.stat()
+        os.utime(
+            generator.FONT_CACHE_FILE,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000),
+        )
+        touched = get_cached_fonts()
+        assert touched is not first
+        assert touched == first
+
+        # Contract: rewriting the cache invalidates the in-process copy
+        assert update_font_cache(fonts[:2])
+        assert len(get_cached_fonts()) == 2
+
+    def test_fetch_google_fonts_defaults_match_per_font_parsing(self):
+        """Test that bulk and per-font parsing fill missing API fields alike."""
+        import brand_identity_generator as generator
+
+        items = [
+            {"family": "Lora", "category": "serif", "variants": ["regular"]},
+            {"family": "Inter", "variants": ["700"], "files": {"700": "https://g"}},
+        ]
+
+        bulk = generator._fonts_adapter().validate_python(
+            items, context=generator.GOOGLE_FONTS_API_CONTEXT
+        )
+        per_font = generator._parse_api_fonts(items)
+
+        # Contract: a font parses the same whether or not a sibling is malformed
+        assert bulk == per_font
+        assert bulk[0].subsets == ["latin"]
+        assert bulk[0].font_files == {}
+        assert bulk[1].category == "sans-serif"
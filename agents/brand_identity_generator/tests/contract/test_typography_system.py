@@ -365,4 +365,75 @@ class TestTypographySystemGeneration:
             if 'css_url' in hierarchy.font_urls:
                 css_url = hierarchy.font_urls['css_url']
                 assert css_url.startswith("https://fonts.googleapis.com/css")
-                assert "Open+Sans" in css_url or "Open%20Sans" in css_url
\ No newline at end of file
+                assert "Open+Sans" in css_url or "Open%20Sans" in css_url
+
+    def test_generate_typography_hierarchy_combined_font_url(self):
+        """Test that the combined URL loads both fonts in one valid request."""
+        from brand_identity_generator import FontRecommendation
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import generate_typography_hierarchy
+
+        def recommendation(family, weights):
+            return FontRecommendation(
+                google_font=GoogleFont(
+                    family=family, category="sans-serif", variants=weights
+                ),
+                confidence_score=0.9,
+                rationale="Clean, readable font for web interfaces",
+                use_cases=["headings", "body"],
+                recommended_weights=weights,
+            )
+
+        hierarchy = generate_typography_hierarchy(
+            recommendation("Open Sans", ["400", "700"]),
+            recommendation("Roboto Slab", ["400"]),
+        )
+
+        # Contract: combined URL is well-formed and matches the CSS import
+        combined_url = hierarchy.font_urls["combined_css"]
+        assert " " not in combined_url
+        assert combined_url == (
+            "https://fonts.googleapis.com/css2?family=Open+Sans:wght@400;700"
+            "&family=Roboto+Slab:wght@400&display=swap"
+        )
+        assert f"@import url('{combined_url}');" in hierarchy.css_snippet
+
+    def test_typography_hierarchy_derived_fields_stay_consistent(self):
+        """Test that css_snippet and font_urls always follow the fonts."""
+        from pydantic import ValidationError
+
+        from brand_identity_generator import FontRecommendation
+        from brand_identity_generator import GoogleFont
+        from brand_identity_generator import TypographyHierarchy
+
+        def recommendation(family):
+            return FontRecommendation(
+                google_font=GoogleFont(
+                    family=family, category="sans-serif", variants=["400"]
+                ),
+                confidence_score=0.9,
+                rationale="Clean, readable font for web interfaces",
+                use_cases=["headings", "body"],
+                recommended_weights=["400"],
+            )
+
+        # Contract: derived fields ignore caller-supplied values
+        hierarchy = TypographyHierarchy(
+            primary_font=recommendation("Open Sans"),
+            css_snippet="custom css",
+            font_urls={"combined_css": "https://example.com"},
+        )
+        assert hierarchy.css_snippet != "custom css"
+        assert "Open+Sans" in hierarchy.font_urls["combined_css"]
+
+        # Contract: fields cannot be reassigned under the cached values
+        with pytest.raises(ValidationError):
+            hierarchy.primary_font = recommendation("Roboto")
+
+        # Contract: an updated copy derives its own values
+        updated = hierarchy.model_copy(
+            update={"primary_font": recommendation("Roboto")}
+        )
+        assert "Roboto" in updated.font_urls["combined_css"]
+        assert "Roboto" in updated.css_snippet
+        assert "Open+Sans" in hierarchy.font_urls["combined_css"]
@@ -351,4 +351,44 @@ We use our custom corporate font for all communications.
             if "processing_time" in metadata:
                 processing_time = metadata["processing_time"]
                 # Core processing should be much faster
-                assert processing_time < 10.0, f"Core processing took {processing_time:.2f}s, should be <10s"
\ No newline at end of file
+                assert processing_time < 10.0, f"Core processing took {processing_time:.2f}s, should be <10s"
+
+    def test_cli_batch_mode_resumes_from_checkpoint(self, tmp_path):
+        """Test that batch mode appends JSONL results and skips completed files."""
+        script = Path(__file__).parent.parent.parent / "brand_identity_generator.py"
+        brands = tmp_path / "brands"
+        brands.mkdir()
+        for name in ("alpha", "beta"):
+            (brands / f"{name}.md").write_text(
+                f"# {name}\n\n**Brand Voice**: professional, modern\n"
+            )
+
+        command = [
+            "python",
+            str(script),
+            "--input-dir",
+            str(brands),
+            "--enhance",
+            "--concurrency",
+            "2",
+        ]
+        result = subprocess.run(command, capture_output=True, text=True, cwd=tmp_path)
+        assert result.returncode == 0, f"Batch run failed: {result.stderr}"
+
+        results_file = tmp_path / "output" / "results.jsonl"
+        records = [json.loads(line) for line in results_file.read_text().splitlines()]
+        assert sorted(Path(record["input_file"]).name for record in records) == [
+            "alpha.md",
+            "beta.md",
+        ]
+        assert all("colorPalette" in record["result"] for record in records)
+
+        # Contract: a rerun only processes files missing from the checkpoint
+        (brands / "gamma.md").write_text("# gamma\n\n**Brand Voice**: friendly\n")
+        result = subprocess.run(command, capture_output=True, text=True, cwd=tmp_path)
+        assert result.returncode == 0, f"Batch resume failed: {result.stderr}"
+
+        records = [json.loads(line) for line in results_file.read_text().splitlines()]
+        assert [Path(record["input_file"]).name for record in records][2:] == [
+            "gamma.md"
+        ]